@@ -1,29 +1,62 @@
+import asyncio
+
+from pydantic_ai import Agent
+from pydantic_ai.messages import (
+    PartDeltaEvent,
+    PartStartEvent,
+    TextPart,
+    TextPartDelta,
+    ToolCallPart,
+)
+
 from src.agent.agent import research_agent
-from groq import Groq
+from src.search.crawler import llama_guard
+
+
+async def stream_answer(prompt: str) -> None:
+    """Run the research agent, printing model text as it is generated.
+
+    The run is driven node by node so tool calls made after some text in the same
+    model response still execute before the final answer is produced.
+    """
+    print("model answer: ", end="", flush=True)
+
+    async with research_agent.iter(prompt) as run:
+        async for node in run:
+            if not Agent.is_model_request_node(node):
+                continue
 
-client = Groq()
+            printed_text = False
+            called_tools = False
+            async with node.stream(run.ctx) as request_stream:
+                async for event in request_stream:
+                    if isinstance(event, PartStartEvent):
+                        if isinstance(event.part, TextPart):
+                            print(event.part.content, end="", flush=True)
+                            printed_text = True
+                        elif isinstance(event.part, ToolCallPart):
+                            called_tools = True
+                    elif isinstance(event, PartDeltaEvent) and isinstance(
+                        event.delta, TextPartDelta
+                    ):
+                        print(event.delta.content_delta, end="", flush=True)
 
+            # Text before a tool call is narration; start the answer on a new line
+            if printed_text and called_tools:
+                print()
 
-def llama_guard(text: str) -> float:
-    completion = client.chat.completions.create(
-        model="meta-llama/llama-prompt-guard-2-86m",
-        messages=[{"role": "user", "content": text}],
-        temperature=1,
-        max_completion_tokens=100,
-        top_p=1,
-        stream=False,
-        stop=None,
-    )
+    print()
 
-    return float(completion.choices[0].message.content)
 
+async def main() -> None:
+    prompt = input("Enter your prompt: ")
 
-prompt = input("Enter your prompt: ")
+    if await llama_guard(prompt) > 0.6:
+        print("Prompt is not safe. Exiting.")
+        exit(1)
+    else:
+        await stream_answer(prompt)
 
-if llama_guard(prompt) > 0.6:
-    print("Prompt is not safe. Exiting.")
-    exit(1)
-else:
-    result = research_agent.run_sync(prompt)
 
-    print(f"model answer: {result.output}")
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,16 +1,24 @@
 from pydantic_ai import Agent, RunContext
 from datetime import datetime
+import asyncio
 from src.search.exa import exa_search
-from src.search.crawler import extract_web_content
+from src.search.crawler import extract_web_content, guard_extractions
+from src.models import ExtractionResult
 from src.utils.logger import get_logger
-import logfire
+import os
 
 
-logfire.configure()
-logfire.instrument_pydantic_ai()
+if os.getenv("LOGFIRE_ENABLED"):
+    import logfire
+
+    logfire.configure()
+    logfire.instrument_pydantic_ai()
 
 logger = get_logger()
 
+# Exa results with less text than this are crawled directly instead
+MIN_CONTENT_LENGTH = 200
+
 
 research_agent = Agent("gemini-2.5-flash-preview-05-20")
 
@@ -51,10 +59,35 @@ async def search(ctx: RunContext[str], query: str | list[str], num_results: int
     logger.info(f"Searching for: {query_list}")
 
     results = await exa_search(query=query_list, num_results=num_results)
-    urls = [result.url for result in results]
-
-    logger.info(f"Extracting content from {len(urls)} URLs for query: {query_list}")
 
-    contents = await extract_web_content(urls=urls, content_filter="safety features")
+    # Sub-queries often return the same pages; keep the best-scoring result per URL
+    unique_results = {}
+    for result in results:
+        seen = unique_results.get(result.url)
+        if seen is None or result.score > seen.score:
+            unique_results[result.url] = result
+    results = list(unique_results.values())
+
+    # Use the page text Exa already returned, crawling only pages where it is missing
+    contents = {}
+    for result in results:
+        if result.text and len(result.text) >= MIN_CONTENT_LENGTH:
+            contents[result.url] = ExtractionResult(
+                url=result.url, success=True, content=result.text, title=result.title
+            )
+    urls = [result.url for result in results if result.url not in contents]
+
+    logger.info(
+        f"Using Exa content for {len(contents)} URLs, extracting content from "
+        f"{len(urls)} URLs for query: {query_list}"
+    )
+
+    guarded, extracted = await asyncio.gather(
+        guard_extractions(list(contents.values())),
+        extract_web_content(urls=urls, content_filter="safety features"),
+    )
+
+    contents = {result.url: result for result in guarded}
+    contents.update(extracted)
 
     return contents
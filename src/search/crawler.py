@@ -1,33 +1,201 @@
 import asyncio
+import hashlib
+import os
 import re
+import weakref
 from typing import Optional
 
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
+from crawl4ai import (
+    AsyncWebCrawler,
+    BrowserConfig,
+    CrawlerRunConfig,
+    CacheMode,
+    MemoryAdaptiveDispatcher,
+    RateLimiter,
+)
 from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
 from crawl4ai.content_filter_strategy import PruningContentFilter
 
 from src.utils.logger import get_logger
+from src.utils.lfu_cache import LFUCache
+from src.utils.semantic_cache import SemanticCache
+from src.utils.groq_client import client
 from src.models import ExtractionResult
 
-from groq import Groq
-
 logger = get_logger()
 
-client = Groq()
+_WS3 = re.compile(r"\n\s*\n\s*\n")
+_WS = re.compile(r"\s+")
+_LINE_EDGES = re.compile(r"^[ \t]+|[ \t]+$", re.MULTILINE)
+# Whole lines to drop: common UI/navigation patterns and anything without
+# substantial content (10 characters or fewer), including empty lines
+_DROP_LINES = re.compile(
+    r"^(?:"
+    r"(?:Menu|Navigation|Skip to|Cookie|Privacy|Terms|Subscribe|Sign up|Log in).*"
+    r"|\d+"  # Just numbers
+    r"|[|•·→←↑↓\- \t]+"  # Just symbols/separators
+    r"|(?:Share|Tweet|Facebook|LinkedIn|Print)"
+    r"|Copyright.*\d{4}.*"
+    r"|.{0,10}"
+    r")$\n?",
+    re.IGNORECASE | re.MULTILINE,
+)
+_TITLE_RE = re.compile(r"<title[^>]*>([^<]+)</title>", re.IGNORECASE)
+# Prompt-injection signals; content without any of them skips the Llama Guard call
+_SUSPECT = re.compile(
+    r"ignore (?:all )?previous|system prompt|jailbreak|<\|endoftext\|>"
+    r"|base64,[A-Za-z0-9+/]{100,}|DAN mode",
+    re.IGNORECASE,
+)
+# Only the start of very long pages is checked for those signals
+SUSPECT_SCAN_CHARS = 64_000
+_SCORE = re.compile(r"\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+
+guard_cache = LFUCache(capacity=50_000, stats_interval=100)
+
+# Maximum number of Groq guard requests in flight across the whole process
+GUARD_MAX_CONCURRENT = 10
+_guard_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Opt-in: reuse guard scores for near-duplicate text (loads an embedding model)
+semantic_guard_cache = SemanticCache() if os.getenv("GUARD_SEMANTIC_CACHE") else None
+
+
+def _parse_guard_score(content: Optional[str]) -> float:
+    """Parse a Llama Guard reply into a score, tolerating non-numeric output.
+
+    Args:
+        content: Raw model reply
 
+    Returns:
+        The first number in the reply, otherwise 1.0 for an "unsafe" verdict and 0.0
+    """
+    content = (content or "").strip()
+    score_match = _SCORE.search(content)
+    if score_match:
+        return float(score_match.group(0))
+    return 1.0 if "unsafe" in content.lower() else 0.0
+
+
+def _guard_cache_key(text: str) -> str:
+    """Hash whitespace-normalized text so trivially different copies share a key."""
+    return hashlib.blake2b(" ".join(text.split()).encode(), digest_size=16).hexdigest()
+
+
+def _guard_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore capping Groq guard requests on the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _guard_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _guard_semaphores[loop] = asyncio.Semaphore(GUARD_MAX_CONCURRENT)
+    return semaphore
+
+
+async def _raw_llama_guard(text: str) -> float:
+    async with _guard_semaphore():
+        completion = await client.chat.completions.create(
+            model="meta-llama/llama-prompt-guard-2-86m",
+            messages=[{"role": "user", "content": text}],
+            temperature=1,
+            max_completion_tokens=100,
+            top_p=1,
+            stream=False,
+            stop=None,
+        )
 
-def llama_guard(text: str) -> float:
-    completion = client.chat.completions.create(
-        model="meta-llama/llama-prompt-guard-2-86m",
-        messages=[{"role": "user", "content": text}],
-        temperature=1,
-        max_completion_tokens=100,
-        top_p=1,
-        stream=False,
-        stop=None,
-    )
+    return _parse_guard_score(completion.choices[0].message.content)
 
-    return float(completion.choices[0].message.content)
+
+async def llama_guard(text: str) -> float:
+    """Score text with Llama Guard, reusing cached scores for previously seen text.
+
+    When GUARD_SEMANTIC_CACHE is set, scores are also reused for near-duplicate text.
+
+    Args:
+        text: Text to score
+
+    Returns:
+        Guard score for the text, or 0.0 if the guard request fails
+    """
+    key = _guard_cache_key(text)
+    score = guard_cache.get(key)
+    if score is not None:
+        return score
+
+    if semantic_guard_cache is not None:
+        # Embedding and the faiss search are CPU-bound, so keep them off the loop
+        score, embeddings = await asyncio.to_thread(semantic_guard_cache.lookup, text)
+        # Approximate verdicts are not stored under this text's exact hash
+        if score is not None:
+            return score
+
+    try:
+        score = await _raw_llama_guard(text)
+    except Exception as e:
+        logger.warning(f"Llama Guard request failed, treating text as safe: {str(e)}")
+        return 0.0
+
+    guard_cache.put(key, score)
+    if semantic_guard_cache is not None:
+        await asyncio.to_thread(semantic_guard_cache.put, embeddings, score)
+    return score
+
+
+async def llama_guard_batch(texts: list[str]) -> list[float]:
+    """Score multiple texts with Llama Guard in a single round of requests.
+
+    Prompt Guard classifies one input per request, so the requests are issued
+    together and awaited as a batch rather than one after another. Groq requests
+    are capped process-wide at GUARD_MAX_CONCURRENT.
+
+    Args:
+        texts: Texts to score
+
+    Returns:
+        Guard scores in the same order as texts
+    """
+    if not texts:
+        return []
+
+    return list(await asyncio.gather(*[llama_guard(text) for text in texts]))
+
+
+async def guard_extractions(results: list[ExtractionResult]) -> list[ExtractionResult]:
+    """Run Llama Guard over all successful extractions in one batch.
+
+    Extractions without any prompt-injection signal are treated as safe without
+    calling Groq.
+
+    Args:
+        results: Unguarded extraction results
+
+    Returns:
+        Extraction results with guard verdicts applied, in the same order
+    """
+    pending = [
+        i
+        for i, r in enumerate(results)
+        if r.success and _SUSPECT.search(r.content, 0, SUSPECT_SCAN_CHARS)
+    ]
+    if not pending:
+        return results
+
+    guarded = list(results)
+    try:
+        scores = await llama_guard_batch([results[i].content for i in pending])
+    except Exception as e:
+        logger.error(f"Llama Guard failed for {len(pending)} extractions: {str(e)}")
+        for i in pending:
+            guarded[i] = ExtractionResult(url=results[i].url, success=False, error=str(e))
+        return guarded
+
+    for i, score in zip(pending, scores):
+        if score > 0.6:
+            guarded[i] = ExtractionResult(
+                url=results[i].url, success=False, error="Content blocked by Llama Guard"
+            )
+
+    return guarded
 
 
 class ContentExtractor:
@@ -63,37 +231,12 @@ class ContentExtractor:
             return ""
 
         # Remove excessive whitespace
-        content = re.sub(r"\n\s*\n\s*\n", "\n\n", content)
-        content = re.sub(r"\s+", " ", content)
-
-        # Remove common navigation and UI elements
-        lines = content.split("\n")
-        cleaned_lines = []
-
-        for line in lines:
-            line = line.strip()
-
-            # Skip empty lines
-            if not line:
-                continue
-
-            # Skip common UI/navigation patterns
-            skip_patterns = [
-                r"^(Menu|Navigation|Skip to|Cookie|Privacy|Terms|Subscribe|Sign up|Log in).*",
-                r"^\d+$",  # Just numbers
-                r"^[|•·→←↑↓\-\s]+$",  # Just symbols/separators
-                r"^(Share|Tweet|Facebook|LinkedIn|Print)$",
-                r"^Copyright.*\d{4}.*",
-            ]
-
-            if any(re.match(pattern, line, re.IGNORECASE) for pattern in skip_patterns):
-                continue
-
-            # Keep lines with substantial content (more than 10 characters)
-            if len(line) > 10:
-                cleaned_lines.append(line)
+        content = _WS3.sub("\n\n", content)
+        content = _WS.sub(" ", content)
 
-        return "\n".join(cleaned_lines).strip()
+        # Remove common navigation and UI elements in a single pass over the text
+        content = _LINE_EDGES.sub("", content)
+        return _DROP_LINES.sub("", content).strip()
 
     def _extract_title(self, html: str) -> Optional[str]:
         """Extract page title from HTML.
@@ -104,81 +247,93 @@ class ContentExtractor:
         Returns:
             Page title if found, None otherwise
         """
-        title_match = re.search(r"<title[^>]*>([^<]+)</title>", html, re.IGNORECASE)
+        # The title sits near the top of the head, so only scan a window around
+        # the first lowercase tag and fall back to a full scan otherwise
+        start = html.find("<title")
+        title_match = _TITLE_RE.search(html, start, start + 4096) if start >= 0 else None
+        if title_match is None:
+            title_match = _TITLE_RE.search(html)
         if title_match:
             return title_match.group(1).strip()
         return None
 
-    async def extract_content(
-        self, url: str, content_filter: Optional[str] = None
-    ) -> ExtractionResult:
-        """Extract content from a single URL.
+    def _run_config(self, content_filter: Optional[str] = None) -> CrawlerRunConfig:
+        """Build the crawler run configuration.
 
         Args:
-            url: URL to extract content from
             content_filter: Optional filter query for content pruning
 
         Returns:
-            ExtractionResult containing the extracted content
+            CrawlerRunConfig for the crawl
         """
-        try:
-            logger.info(f"Extracting content from: {url}")
+        filter_strategy = (
+            PruningContentFilter(user_query=content_filter)
+            if content_filter
+            else PruningContentFilter()
+        )
 
-            # Configure crawler
-            filter_strategy = (
-                PruningContentFilter(user_query=content_filter)
-                if content_filter
-                else PruningContentFilter()
-            )
+        return CrawlerRunConfig(
+            cache_mode=CacheMode.BYPASS,
+            markdown_generator=DefaultMarkdownGenerator(content_filter=filter_strategy),
+            stream=True,
+        )
 
-            config = CrawlerRunConfig(
-                cache_mode=CacheMode.BYPASS,
-                markdown_generator=DefaultMarkdownGenerator(content_filter=filter_strategy),
-            )
+    def _process(self, url: str, result) -> ExtractionResult:
+        """Clean a crawl result into an unguarded extraction result.
 
-            # Extract content
-            async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                result = await crawler.arun(url=url, config=config)
+        Args:
+            url: URL the result was crawled from
+            result: Crawl result returned by the crawler
 
-            if not result.success:
-                return ExtractionResult(
-                    url=url, success=False, error="Failed to fetch content from URL"
-                )
+        Returns:
+            ExtractionResult containing the cleaned, unguarded content
+        """
+        if isinstance(result, Exception):
+            logger.error(f"Content extraction failed for {url}: {str(result)}")
+            return ExtractionResult(url=url, success=False, error=str(result))
 
-            # Extract and clean content
-            raw_content = getattr(result, "markdown_v2", None)
-            if raw_content and hasattr(raw_content, "raw_markdown"):
-                content = raw_content.raw_markdown
-            else:
-                content = getattr(result, "markdown", "")
+        if not result.success:
+            return ExtractionResult(
+                url=url, success=False, error="Failed to fetch content from URL"
+            )
 
-            cleaned_content = self._clean_content(content)
-            title = self._extract_title(getattr(result, "html", ""))
+        # Extract and clean content
+        raw_content = getattr(result, "markdown_v2", None)
+        if raw_content and hasattr(raw_content, "raw_markdown"):
+            content = raw_content.raw_markdown
+        else:
+            content = getattr(result, "markdown", "")
 
-            logger.info(
-                f"Successfully extracted {len(cleaned_content)} characters from {url}"
-            )
+        cleaned_content = self._clean_content(content)
+        title = self._extract_title(getattr(result, "html", ""))
 
-            guard_result = llama_guard(cleaned_content)
+        logger.info(f"Successfully extracted {len(cleaned_content)} characters from {url}")
 
-            if guard_result > 0.6:
-                return ExtractionResult(
-                    url=url, success=True, content=cleaned_content, title=title
-                )
-            else:
-                return ExtractionResult(
-                    url=url, success=False, error="Content blocked by Llama Guard"
-                )
+        return ExtractionResult(url=url, success=True, content=cleaned_content, title=title)
 
-        except Exception as e:
-            logger.error(f"Content extraction failed for {url}: {str(e)}")
-            return ExtractionResult(url=url, success=False, error=str(e))
+    async def extract_content(
+        self, url: str, content_filter: Optional[str] = None
+    ) -> ExtractionResult:
+        """Extract content from a single URL.
+
+        Args:
+            url: URL to extract content from
+            content_filter: Optional filter query for content pruning
+
+        Returns:
+            ExtractionResult containing the extracted content
+        """
+        results = await self.extract_multiple([url], content_filter=content_filter)
+        return results[url]
 
     async def extract_multiple(
         self, urls: list[str], max_concurrent: int = 10, content_filter: Optional[str] = None
     ) -> dict[str, ExtractionResult]:
         """Extract content from multiple URLs concurrently.
 
+        All pages are crawled with a single shared browser, and each page is
+        cleaned and scored by Llama Guard as soon as its crawl completes.
+
         Args:
             urls: List of URLs to extract content from
             max_concurrent: Maximum number of concurrent extractions
@@ -192,27 +347,40 @@ class ContentExtractor:
 
         logger.info(f"Extracting content from {len(urls)} URLs")
 
-        # semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def bounded_extract(url: str) -> tuple[str, ExtractionResult]:
-            # async with semaphore:
-            result = await self.extract_content(url, content_filter)
-            return url, result
-
-        # Execute extractions concurrently
-        results = await asyncio.gather(
-            *[bounded_extract(url) for url in urls], return_exceptions=True
-        )
+        config = self._run_config(content_filter)
 
-        # Process results
-        extraction_results = {}
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Extraction failed with exception: {str(result)}")
-                continue
+        guard_tasks = []
+        crawled_urls = set()
+        crawl_error: Exception = RuntimeError("No crawl result returned")
 
-            url, extraction_result = result
-            extraction_results[url] = extraction_result
+        try:
+            async with AsyncWebCrawler(config=self.browser_config) as crawler:
+                # Let crawl4ai schedule the batch, with at most max_concurrent pages open
+                # Keep arun_many's default backoff and retries on 429/503 responses
+                dispatcher = MemoryAdaptiveDispatcher(
+                    max_session_permit=min(max_concurrent, len(urls)),
+                    rate_limiter=RateLimiter(
+                        base_delay=(1.0, 3.0), max_delay=60.0, max_retries=3
+                    ),
+                )
+                async for result in await crawler.arun_many(
+                    urls=urls, config=config, dispatcher=dispatcher
+                ):
+                    # Start guarding each page as soon as it is crawled
+                    crawled_urls.add(result.url)
+                    extraction = self._process(result.url, result)
+                    guard_tasks.append(
+                        asyncio.create_task(guard_extractions([extraction]))
+                    )
+        except Exception as e:
+            logger.error(f"Crawler failed for {len(urls)} URLs: {str(e)}")
+            crawl_error = e
+
+        failed = [self._process(url, crawl_error) for url in urls if url not in crawled_urls]
+        guarded = [
+            result for batch in await asyncio.gather(*guard_tasks) for result in batch
+        ]
+        extraction_results = {result.url: result for result in guarded + failed}
 
         successful_extractions = sum(1 for r in extraction_results.values() if r.success)
         logger.info(
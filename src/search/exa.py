@@ -1,12 +1,28 @@
 from src.utils.logger import get_logger
-from typing import Optional
+from src.utils.lfu_cache import LFUCache
+from typing import Any, Optional
 from ..models import SearchResult, ExaSearchException
-from exa_py import Exa
+from exa_py import AsyncExa
 import asyncio
 import os
+import time
 
 logger = get_logger()
 
+# Seconds a cached search response is reused for identical search parameters
+SEARCH_CACHE_TTL = 600
+
+search_cache = LFUCache(capacity=1024)
+
+
+def _freeze(value: Any) -> Any:
+    """Convert search parameters into a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
 class ExaSearchTool:
     def __init__(self, api_key: Optional[str] = None):
@@ -16,7 +32,7 @@ class ExaSearchTool:
                 "EXA API key must be provided or set in EXA_API_KEY environment variable"
             )
 
-        self.exa = Exa(self.api_key)
+        self.exa = AsyncExa(self.api_key)
         logger.info("EXA Search Tool initialized successfully")
 
     async def search(
@@ -126,16 +142,18 @@ class ExaSearchTool:
             if extras:
                 search_params["extras"] = extras
 
-            # Perform search in thread pool for async compatibility
-            loop = asyncio.get_event_loop()
-            raw_results = await loop.run_in_executor(
-                None, lambda: self.exa.search_and_contents(**search_params)
-            )
+            # Reuse a recent response for identical parameters
+            cache_key = _freeze(search_params)
+            cached = search_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+                logger.info(f"Returning cached results for query: '{query}'")
+                return list(cached[1])
+
+            raw_results = await self.exa.search_and_contents(**search_params)
 
-            # Parse and structure results
-            search_results = []
-            for result in raw_results.results:
-                search_result = SearchResult(
+            # Parse and structure results, skipping validation for trusted Exa fields
+            search_results = [
+                SearchResult.model_construct(
                     title=result.title or "No title",
                     url=result.url,
                     published_date=result.published_date,
@@ -144,7 +162,9 @@ class ExaSearchTool:
                     text=getattr(result, "text", None),
                     summary=getattr(result, "summary", None),
                 )
-                search_results.append(search_result)
+                for result in raw_results.results
+            ]
+            search_cache.put(cache_key, (time.monotonic(), search_results))
 
             logger.info(
                 f"Search completed successfully. Found {len(search_results)} results"
@@ -169,14 +189,14 @@ class ExaSearchTool:
         return asyncio.run(self.search(query, **kwargs))
 
     async def multi_search(
-        self, queries: list[str], max_concurrent: int = 10, **kwargs
+        self, queries: list[str], max_concurrent: int = 5, **kwargs
     ) -> list[list[SearchResult]]:
         """
         Perform multiple searches concurrently.
 
         Args:
             queries: List of search queries to execute
-            max_concurrent: Maximum number of concurrent searches. Default is 3
+            max_concurrent: Maximum number of concurrent searches. Default is 5
             **kwargs: Parameters to apply to all searches
 
         Returns:
@@ -190,11 +210,11 @@ class ExaSearchTool:
 
         logger.info(f"Performing {len(queries)} concurrent searches")
 
-        # semaphore = asyncio.Semaphore(max_concurrent)
+        semaphore = asyncio.Semaphore(max_concurrent)
 
         async def bounded_search(query: str) -> SearchResult:
-            # async with semaphore:
-            return await self.search(query, **kwargs)
+            async with semaphore:
+                return await self.search(query, **kwargs)
 
         results = await asyncio.gather(
             *[bounded_search(query) for query in queries], return_exceptions=True
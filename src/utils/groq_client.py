@@ -0,0 +1,9 @@
+import httpx
+from groq import AsyncGroq, DefaultAsyncHttpxClient
+
+# Shared client so every Groq call reuses one connection pool
+client = AsyncGroq(
+    http_client=DefaultAsyncHttpxClient(
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    )
+)
@@ -0,0 +1,118 @@
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Hashable, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class LFUCache:
+    """Thread-safe least-frequently-used cache with O(1) lookups and evictions."""
+
+    def __init__(
+        self,
+        capacity: int = 50_000,
+        stats_interval: int = 0,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            capacity: Maximum number of entries kept before evicting
+            stats_interval: Log hit/miss stats every N lookups (0 disables logging)
+            on_evict: Optional callback invoked with the key and value of evicted entries
+        """
+        self.capacity = capacity
+        self.stats_interval = stats_interval
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+
+        self._values: dict[Hashable, Any] = {}
+        self._freqs: dict[Hashable, int] = {}
+        # Keys per frequency, oldest first so ties evict least recently used
+        self._buckets: defaultdict[int, OrderedDict] = defaultdict(OrderedDict)
+        self._min_freq = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _touch(self, key: Hashable) -> None:
+        freq = self._freqs[key]
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+
+        self._freqs[key] = freq + 1
+        self._buckets[freq + 1][key] = None
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        lookups = self.hits + self.misses
+        if self.stats_interval and lookups % self.stats_interval == 0:
+            logger.info(
+                f"LFU cache stats: {len(self._values)} entries, "
+                f"{self.hits}/{lookups} hits ({self.hits / lookups:.1%})"
+            )
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if it is not cached."""
+        with self._lock:
+            hit = key in self._values
+            self._record(hit)
+            if not hit:
+                return default
+
+            self._touch(key)
+            return self._values[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least frequently used entry if full."""
+        if self.capacity <= 0:
+            return
+
+        with self._lock:
+            if key in self._values:
+                self._values[key] = value
+                self._touch(key)
+                return
+
+            if len(self._values) >= self.capacity:
+                evicted, _ = self._buckets[self._min_freq].popitem(last=False)
+                if not self._buckets[self._min_freq]:
+                    del self._buckets[self._min_freq]
+                evicted_value = self._values.pop(evicted)
+                del self._freqs[evicted]
+                if self.on_evict:
+                    self.on_evict(evicted, evicted_value)
+
+            self._values[key] = value
+            self._freqs[key] = 1
+            self._buckets[1][key] = None
+            self._min_freq = 1
+
+    def get_or_compute(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: Cache key
+            fn: Zero-argument callable producing the value on a miss
+
+        Returns:
+            The cached or freshly computed value
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = fn()
+            self.put(key, value)
+        return value
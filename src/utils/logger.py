@@ -1,8 +1,26 @@
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
-import inspect
+import queue
+import sys
 
 
+_loggers: dict[str, logging.Logger] = {}
+
+# Records are queued by the logging call and written by a background listener
+# thread, so slow stream or file I/O never blocks the caller
+_formatter = logging.Formatter("{asctime} - {levelname} - {message}", style="{")
+_log_queue: queue.Queue = queue.Queue()
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(_formatter)
+_listener = logging.handlers.QueueListener(_log_queue, _console_handler)
+_listener.start()
+atexit.register(_listener.stop)
+
+
+@functools.lru_cache(maxsize=1)
 def get_repo_root() -> str:
     """
     Returns the absolute path to the repository root.
@@ -21,7 +39,7 @@ def get_repo_root() -> str:
 def get_caller_file() -> str:
     """Get the filename (without extension) of the calling file efficiently."""
     # Go up 2 frames: current frame -> get_logger frame -> actual caller frame
-    frame = inspect.currentframe().f_back.f_back
+    frame = sys._getframe(2)
     filename = os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
 
     return filename
@@ -31,31 +49,32 @@ def get_logger() -> logging.Logger:
     """
     Returns a logger configured to write to the repo-level logs directory and to stdout.
     The logger name and log file are automatically set to the caller's filename.
+    Records are handed to a background listener thread that performs the writes.
     Only configures handlers if not already set for this logger.
     """
     name = get_caller_file()
+    if name in _loggers:
+        return _loggers[name]
+
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
 
     if not logger.handlers:
-        # Create formatters
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-
         if os.getenv("CURRENT_ENV") == "DEV":
             repo_root = get_repo_root()
             logs_dir = os.path.join(repo_root, "logs")
             os.makedirs(logs_dir, exist_ok=True)
             log_file = os.path.join(logs_dir, f"{name}.log")
-            # File handler
+            # File handler, written by the listener for this logger's records only
             file_handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            file_handler.setFormatter(_formatter)
+            file_handler.addFilter(logging.Filter(name))
+            _listener.handlers = _listener.handlers + (file_handler,)
 
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
 
         # Prevent propagation to root logger
         logger.propagate = False
 
+    _loggers[name] = logger
     return logger
@@ -0,0 +1,163 @@
+import itertools
+import threading
+from typing import Any, Optional
+
+from src.utils.lfu_cache import LFUCache
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class SemanticCache:
+    """Embedding-based cache that reuses values for near-duplicate text.
+
+    Requires the optional sentence-transformers and faiss-cpu packages. The whole
+    whitespace-normalized text is embedded in fixed-size chunks, and a lookup only
+    hits an entry with the same number of chunks whose every chunk, position by
+    position, is similar enough to the text being looked up. Texts longer than
+    max_chunks chunks are never cached, which bounds the index at
+    capacity * max_chunks vectors.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 2_000,
+        threshold: float = 0.95,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        chunk_chars: int = 512,
+        max_chunks: int = 16,
+        neighbors: int = 16,
+    ):
+        """Initialize the cache and load the embedding model.
+
+        Args:
+            capacity: Maximum number of entries kept before evicting
+            threshold: Minimum cosine similarity every chunk needs for a hit
+            model_name: Sentence-transformers model used to embed text
+            chunk_chars: Number of characters embedded per chunk
+            max_chunks: Maximum number of chunks in a cacheable text
+            neighbors: Nearest chunks considered per chunk during a lookup
+        """
+        import faiss
+        from sentence_transformers import SentenceTransformer
+
+        self.threshold = threshold
+        self.chunk_chars = chunk_chars
+        self.max_chunks = max_chunks
+        self.neighbors = neighbors
+
+        self._model = SentenceTransformer(model_name)
+        dimension = self._model.get_sentence_embedding_dimension()
+        # Inner product over normalized vectors is cosine similarity
+        self._index = faiss.IndexIDMap(faiss.IndexFlatIP(dimension))
+        self._values = LFUCache(capacity=capacity, on_evict=self._remove)
+        # Chunk id -> (entry id, chunk position), and entry id -> its chunk ids
+        self._chunks: dict[int, tuple[int, int]] = {}
+        self._entries: dict[int, list[int]] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+        logger.info(f"Semantic cache initialized with {model_name}")
+
+    def _remove(self, entry_id: int, value: Any) -> None:
+        import numpy as np
+
+        chunk_ids = self._entries.pop(entry_id)
+        for chunk_id in chunk_ids:
+            del self._chunks[chunk_id]
+        self._index.remove_ids(np.array(chunk_ids, dtype="int64"))
+
+    def embed(self, text: str):
+        """Embed the whole whitespace-normalized text, one vector per chunk.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            A (chunks, dimension) float32 array of normalized vectors, or None if
+            the text has more than max_chunks chunks
+        """
+        normalized = " ".join(text.split())
+        if len(normalized) > self.chunk_chars * self.max_chunks:
+            return None
+
+        chunks = [
+            normalized[start : start + self.chunk_chars]
+            for start in range(0, max(len(normalized), 1), self.chunk_chars)
+        ]
+        return self._model.encode(
+            chunks, normalize_embeddings=True, convert_to_numpy=True
+        ).astype("float32")
+
+    def lookup(self, text: str) -> tuple[Optional[Any], Any]:
+        """Embed text and look it up. Blocking; run it off the event loop.
+
+        Args:
+            text: Text to look up
+
+        Returns:
+            The cached value or None, and the embeddings to pass to put (None if
+            the text is too long to cache)
+        """
+        embeddings = self.embed(text)
+        if embeddings is None:
+            return None, None
+        return self.get(embeddings), embeddings
+
+    def get(self, embeddings) -> Optional[Any]:
+        """Return the value of a cached text matching every chunk, if any.
+
+        Args:
+            embeddings: Chunk embeddings returned by embed
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        with self._lock:
+            if self._index.ntotal == 0:
+                return None
+
+            similarities, ids = self._index.search(
+                embeddings, min(self.neighbors, self._index.ntotal)
+            )
+
+            candidates: Optional[set[int]] = None
+            for position, row in enumerate(zip(similarities, ids)):
+                matches = set()
+                for similarity, chunk_id in zip(*row):
+                    chunk = self._chunks.get(int(chunk_id))
+                    if chunk is None or similarity < self.threshold:
+                        continue
+                    entry_id, entry_position = chunk
+                    if entry_position == position:
+                        matches.add(entry_id)
+
+                candidates = matches if candidates is None else candidates & matches
+                if not candidates:
+                    return None
+
+            for entry_id in candidates:
+                if len(self._entries[entry_id]) == len(embeddings):
+                    return self._values.get(entry_id)
+        return None
+
+    def put(self, embeddings, value: Any) -> None:
+        """Store value for the text the chunk embeddings were computed from.
+
+        Args:
+            embeddings: Chunk embeddings returned by embed, or None to skip caching
+            value: Value to cache
+        """
+        import numpy as np
+
+        if embeddings is None:
+            return
+
+        with self._lock:
+            entry_id = next(self._ids)
+            chunk_ids = [next(self._ids) for _ in range(len(embeddings))]
+            self._index.add_with_ids(embeddings, np.array(chunk_ids, dtype="int64"))
+            for position, chunk_id in enumerate(chunk_ids):
+                self._chunks[chunk_id] = (entry_id, position)
+            self._entries[entry_id] = chunk_ids
+            self._values.put(entry_id, value)